@@ -44,15 +44,16 @@ def convert(topology, backend, device=None, extra_config={}):
 
         onnx_backend = onnx.__name__
 
-    for operator in topology.topological_operator_iterator():
+    if backend == onnx_backend:
+        # Pytorch has a bug with exporting GEMM into ONNX.
+        # For the moment only tree_trav is enabled.
+        extra_config[constants.TREE_IMPLEMENTATION] = "tree_trav"
+
+    # Sort the operators only once: the same order is used for conversion and by the backend model.
+    operators = list(topology.topological_operator_iterator())
+    for operator in operators:
         try:
             converter = get_converter(operator.type)
-
-            if backend == onnx_backend:
-                # Pytorch has a bug with exporting GEMM into ONNX.
-                # For the moment only tree_trav is enabled.
-                extra_config[constants.TREE_IMPLEMENTATION] = "tree_trav"
-
             operator_map[operator.full_name] = converter(operator, device, extra_config)
         except ValueError:
             raise MissingConverter(
@@ -63,7 +64,6 @@ def convert(topology, backend, device=None, extra_config={}):
         except Exception as e:
             raise e
 
-    operators = list(topology.topological_operator_iterator())
     if operator_map[operators[-1].full_name].regression:
         # We are doing a regression task.
         pytorch_container = PyTorchBackendModelRegression
@@ -7,24 +7,26 @@
 """
 Hummingbird main (converters) API.
 """
-from copy import deepcopy
 import numpy as np
 
-from .operator_converters import constants
-from ._parse import parse_sklearn_api_model, parse_onnx_api_model
-from ._topology import convert as topology_converter
 from ._utils import torch_installed, lightgbm_installed, xgboost_installed, onnx_runtime_installed
 from .exceptions import MissingConverter, MissingBackend
 from .supported import backends
 
-# Invoke the registration of all our converters.
-from . import operator_converters  # noqa
-
 # Set up the converter dispatcher.
 from .supported import xgb_operator_list  # noqa
 from .supported import lgbm_operator_list  # noqa
 
 
+def _register_converters():
+    """
+    Function invoking the registration of all our converters.
+    Converters (and their dependencies, e.g., PyTorch) are only imported once a model is actually converted.
+    Python caches the import, therefore calling this function more than once is cheap.
+    """
+    from . import operator_converters  # noqa: F401
+
+
 def _is_onnx_model(model):
     """
     Function returning whether the input model is an ONNX model or not.
@@ -35,6 +37,7 @@ def _is_onnx_model(model):
 def _supported_backend_check(backend):
     """
     Function used to check whether the specified backend is supported or not.
+    The input backend is expected to be already lower case, since `backends` only contains lower case names.
     """
     if backend not in backends:
         raise MissingBackend("Backend: {}".format(backend))
@@ -82,10 +85,12 @@ def _convert_sklearn(model, test_input=None, extra_config={}):
     assert torch_installed(), "To use Hummingbird you need to install torch."
 
     import torch
+    from ._parse import parse_sklearn_api_model
+    from ._topology import convert as topology_converter
+
+    _register_converters()
 
     # Parse scikit-learn model as our internal data structure (i.e., Topology)
-    # We modify the scikit learn model during translation.
-    model = deepcopy(model)
     topology = parse_sklearn_api_model(model)
 
     # Convert the Topology object into a PyTorch model.
@@ -140,11 +145,23 @@ def _convert_xgboost(model, test_input, extra_config={}):
         xgboost_installed()
     ), "To convert XGboost models you need to instal XGBoost (or `pip install hummingbird-ml[extra]`)."
 
+    from .operator_converters import constants
+
     # XGBoostRegressor and Classifier have different APIs for extracting the number of features.
-    # In the former case we need to infer them from the test_input.
+    # In the former case we first try to get them from the booster, and otherwise we infer them from the test_input.
     if constants.N_FEATURES not in extra_config:
+        n_features = None
         if "_features_count" in dir(model):
-            extra_config[constants.N_FEATURES] = model._features_count
+            n_features = model._features_count
+        else:
+            try:
+                n_features = model.get_booster().num_features()
+            except AttributeError:
+                # Booster.num_features is not available in older versions of XGBoost.
+                pass
+
+        if n_features is not None:
+            extra_config[constants.N_FEATURES] = n_features
         elif test_input is not None:
             if type(test_input) is np.ndarray and len(test_input.shape) == 2:
                 extra_config[constants.N_FEATURES] = test_input.shape[1]
@@ -192,6 +209,11 @@ def _convert_onnxml(model, test_input=None, extra_config={}):
     ), "To use the onnxml converter you need to install onnxruntime (or `pip install hummingbird-ml[onnx]`)."
 
     import onnx
+    from ._parse import parse_onnx_api_model
+    from ._topology import convert as topology_converter
+    from .operator_converters import constants
+
+    _register_converters()
 
     # The conversion requires some test input for tracing.
     # Test inputs can be either provided or generate from the inital types.
@@ -213,18 +235,19 @@ def _convert_onnxml(model, test_input=None, extra_config={}):
 
         from onnxconverter_common.data_types import FloatTensorType, Int32TensorType
 
-        test_input = np.random.rand(initial_types[0][1].shape[0], initial_types[0][1].shape[1])
         extra_config[constants.N_FEATURES] = initial_types[0][1].shape[1]
         if type(initial_types[0][1]) is FloatTensorType:
-            test_input = np.array(test_input, dtype=np.float32)
+            dtype = np.float32
         elif type(initial_types[0][1]) is Int32TensorType:
-            test_input = np.array(test_input, dtype=np.int32)
+            dtype = np.int32
         else:
             raise RuntimeError(
                 "Type {} not supported. Please fill an issue on https://github.com/microsoft/hummingbird/.".format(
                     type(initial_types[0][1])
                 )
             )
+        # The test input is only used for tracing, therefore its values do not matter.
+        test_input = np.zeros((initial_types[0][1].shape[0], initial_types[0][1].shape[1]), dtype=dtype)
     else:
         extra_config[constants.N_FEATURES] = np.array(test_input).shape[1]
     extra_config[constants.ONNX_TEST_INPUT] = test_input
@@ -174,8 +174,9 @@ def get_parameters_for_sklearn_common(tree_infos):
         tree_infos: The information representing a tree (ensemble)
         Returns: The tree parameters wrapped into an instance of `operator_converters._tree_commons_TreeParameters`
     """
-    lefts = tree_infos.tree_.children_left
-    rights = tree_infos.tree_.children_right
+    # children_left / children_right are views over the sklearn tree, and they are rewritten during conversion.
+    lefts = np.array(tree_infos.tree_.children_left)
+    rights = np.array(tree_infos.tree_.children_right)
     features = tree_infos.tree_.feature
     thresholds = tree_infos.tree_.threshold
     values = tree_infos.tree_.value
@@ -14,6 +14,18 @@ from onnxconverter_common.registration import register_converter
 from ._linear_implementations import LinearModel
 
 
+def _attr_to_ndarray(attr, dtype):
+    """
+    Function returning the values of a repeated numeric (`INTS` or `FLOATS`) ONNX attribute as an ndarray of type *dtype*.
+    """
+    if attr.type == attr.INTS:
+        return np.asarray(attr.ints, dtype=dtype)
+    if attr.type == attr.FLOATS:
+        return np.asarray(attr.floats, dtype=dtype)
+    attr_type = attr.AttributeType.Name(attr.type)
+    raise RuntimeError("Error parsing LinearClassifier, unexpected type {} for attribute {}".format(attr_type, attr.name))
+
+
 def convert_onnx_linear_model(operator, device=None, extra_config={}):
     """
     Converter for `ai.onnx.ml.LinearClassifier`.
@@ -33,20 +45,26 @@ def convert_onnx_linear_model(operator, device=None, extra_config={}):
     coefficients = intercepts = classes = multi_class = None
     is_linear_regression = False
 
-    for attr in operator.origin.attribute:
-        if attr.name == "coefficients":
-            coefficients = np.array(attr.floats).astype("float32")
-        elif attr.name == "intercepts":
-            intercepts = np.array(attr.floats).astype("float32")
-        elif attr.name == "classlabels_ints":
-            classes = np.array(attr.ints)
-        elif attr.name == "multi_class":
-            if attr.i != 0:  # https://github.com/onnx/onnx/blob/master/docs/Operators-ml.md#ai.onnx.ml.LinearClassifier
-                multi_class = "multinomial"
-
-    if any(v is None for v in [coefficients, intercepts, classes]):
-        print("coefficients{}, intercepts{},  classes{}".format(coefficients, intercepts, classes))
-        raise RuntimeError("Error parsing LinearClassifier, found unexpected None")
+    # Index the attributes by name once, instead of scanning them for each attribute of interest.
+    attrs = {attr.name: attr for attr in operator.origin.attribute}
+    if "coefficients" in attrs:
+        coefficients = _attr_to_ndarray(attrs["coefficients"], np.float32)
+    if "intercepts" in attrs:
+        intercepts = _attr_to_ndarray(attrs["intercepts"], np.float32)
+    if "classlabels_ints" in attrs:
+        classes = _attr_to_ndarray(attrs["classlabels_ints"], np.int64)
+    if "multi_class" in attrs and attrs["multi_class"].i != 0:
+        # https://github.com/onnx/onnx/blob/master/docs/Operators-ml.md#ai.onnx.ml.LinearClassifier
+        multi_class = "multinomial"
+
+    if coefficients is None or intercepts is None or classes is None:
+        # Only report the shapes: printing large coefficient arrays can be slow.
+        shapes = [None if v is None else v.shape for v in (coefficients, intercepts, classes)]
+        raise RuntimeError(
+            "Error parsing LinearClassifier, found unexpected None (coefficients {}, intercepts {}, classes {})".format(
+                *shapes
+            )
+        )
     if multi_class is None:  # if 'multi_class' attr was not present
         multi_class = "none" if len(classes) < 3 else "ovr"
     if operator.op_type == "LinearRegressor":
@@ -55,19 +73,16 @@ def convert_onnx_linear_model(operator, device=None, extra_config={}):
     # Now reshape the coefficients/intercepts
     if len(classes) == 2:
         # for the binary case, it seems there is a duplicate copy of everything with opposite +/- sign. This just takes the correct copy
-        coefficients = np.array([[np.array(val).astype("float32")] for val in coefficients[len(coefficients) // 2 :]]).astype(
-            "float32"
-        )
-        intercepts = np.array([[np.array(val).astype("float32")] for val in intercepts[len(intercepts) // 2 :]]).astype(
-            "float32"
-        )
+        # We copy the selected half so that the model does not keep the other half alive through a view.
+        coefficients = coefficients[coefficients.shape[0] // 2 :].reshape(-1, 1).copy()
+        intercepts = intercepts[intercepts.shape[0] // 2 :].reshape(-1, 1).copy()
     elif len(classes) > 2:
         # intercepts are OK in this case.
 
         # reshape coefficients into tuples
-        tmp = coefficients.reshape(len(classes), (len(coefficients) // len(classes)))
+        tmp = coefficients.reshape(len(classes), -1)
         # then unzip the zipmap format
-        coefficients = np.array(list(zip(*tmp)))
+        coefficients = np.ascontiguousarray(tmp.T)
     else:
         raise RuntimeError("Error parsing LinearClassifier, length of classes {} unexpected:{}".format(len(classes), classes))
     return LinearModel(
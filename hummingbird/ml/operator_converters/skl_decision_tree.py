@@ -31,8 +31,14 @@ def convert_sklearn_random_forest_classifier(operator, device, extra_config):
     """
     assert operator is not None
 
+    return _convert_sklearn_tree_classifier(operator.raw_operator.estimators_, operator, extra_config)
+
+
+def _convert_sklearn_tree_classifier(tree_infos, operator, extra_config):
+    """
+    Common converter for sklearn tree-based classifiers, given the list of their trees.
+    """
     # Get tree information out of the model.
-    tree_infos = operator.raw_operator.estimators_
     n_features = operator.raw_operator.n_features_
     classes = operator.raw_operator.classes_.tolist()
 
@@ -59,8 +65,14 @@ def convert_sklearn_random_forest_regressor(operator, device, extra_config):
     """
     assert operator is not None
 
+    return _convert_sklearn_tree_regressor(operator.raw_operator.estimators_, operator, extra_config)
+
+
+def _convert_sklearn_tree_regressor(tree_infos, operator, extra_config):
+    """
+    Common converter for sklearn tree-based regressors, given the list of their trees.
+    """
     # Get tree information out of the operator.
-    tree_infos = operator.raw_operator.estimators_
     n_features = operator.raw_operator.n_features_
 
     return convert_decision_ensemble_tree_common(
@@ -86,8 +98,7 @@ def convert_sklearn_decision_tree_classifier(operator, device, extra_config):
     """
     assert operator is not None
 
-    operator.raw_operator.estimators_ = [operator.raw_operator]
-    return convert_sklearn_random_forest_classifier(operator, device, extra_config)
+    return _convert_sklearn_tree_classifier([operator.raw_operator], operator, extra_config)
 
 
 def convert_sklearn_decision_tree_regressor(operator, device, extra_config):
@@ -104,8 +115,7 @@ def convert_sklearn_decision_tree_regressor(operator, device, extra_config):
     """
     assert operator is not None
 
-    operator.raw_operator.estimators_ = [operator.raw_operator]
-    return convert_sklearn_random_forest_regressor(operator, device, extra_config)
+    return _convert_sklearn_tree_regressor([operator.raw_operator], operator, extra_config)
 
 
 # Register the converters.
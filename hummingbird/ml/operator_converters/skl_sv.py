@@ -24,13 +24,14 @@ class SVC(BaseOperator, torch.nn.Module):
         self.gamma = gamma
         self.regression = False
         sv = sv.toarray() if type(sv) == scipy.sparse.csr.csr_matrix else sv
-        self.sv = torch.nn.Parameter(torch.from_numpy(sv).double(), requires_grad=False)
+        self.sv = torch.nn.Parameter(torch.from_numpy(sv.astype("float64")), requires_grad=False)
         self.sv_t = torch.nn.Parameter(torch.transpose(self.sv, 0, 1), requires_grad=False)
         self.sv_norm = torch.nn.Parameter(-self.gamma * (self.sv ** 2).sum(1).view(1, -1), requires_grad=False)
         self.coef0 = coef0
         self.n_features = sv.shape[1]
         self.a = a
-        self.b = torch.nn.Parameter(torch.nn.Parameter(torch.from_numpy(b.reshape(1, -1)).double()), requires_grad=False)
+        b = b.reshape(1, -1).astype("float64")
+        self.b = torch.nn.Parameter(torch.nn.Parameter(torch.from_numpy(b)), requires_grad=False)
         self.start = [sum(nv[:i]) for i in range(len(nv))]
         self.end = [self.start[i] + nv[i] for i in range(len(nv))]
         self.len_nv = len(nv)
@@ -182,7 +182,7 @@ def _build_backend_map():
 
         backends.add(onnx.__name__)
 
-    return backends
+    return frozenset(backends)
 
 
 def _build_sklearn_api_operator_name_map():
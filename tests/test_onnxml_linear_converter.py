@@ -11,6 +11,8 @@ from sklearn.svm import LinearSVC, SVC, NuSVC
 
 from hummingbird.ml._utils import onnx_ml_tools_installed, onnx_runtime_installed, lightgbm_installed
 from hummingbird.ml import convert
+from hummingbird.ml._parse import parse_onnx_api_model
+from hummingbird.ml.operator_converters.onnxml_linear import convert_onnx_linear_model
 
 if onnx_runtime_installed():
     import onnxruntime as ort
@@ -87,6 +89,33 @@ class TestSklearnNormalizer(unittest.TestCase):
             list(map(lambda x: list(x.values()), onnx_ml_pred[0])), onnx_pred[0], rtol=rtol, atol=atol
         )  # probs
 
+    @unittest.skipIf(
+        not (onnx_ml_tools_installed() and onnx_runtime_installed()), reason="ONNXML test requires ONNX, ORT and ONNXMLTOOLS"
+    )
+    def test_logistic_regression_onnxml_multi_coefficients(self):
+        n_features = 20
+        n_total = 100
+        np.random.seed(0)
+        warnings.filterwarnings("ignore")
+        X = np.random.rand(n_total, n_features)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(3, size=n_total)
+
+        # Create SKL model for testing
+        model = LogisticRegression(solver="lbfgs", fit_intercept=True)
+        model.fit(X, y)
+
+        # Create ONNX-ML model
+        onnx_ml_model = convert_sklearn(model, initial_types=[("float_input", FloatTensorType_onnx(X.shape))])
+
+        # Convert the LinearClassifier operator only and check the layout of the coefficients
+        topology = parse_onnx_api_model(onnx_ml_model)
+        operator = [op for op in topology.topological_operator_iterator() if op.type == "ONNXMLLinearClassifier"][0]
+        linear_model = convert_onnx_linear_model(operator)
+
+        self.assertEqual(linear_model.coefficients.shape, (n_features, 3))
+        np.testing.assert_allclose(linear_model.coefficients.numpy(), model.coef_.T, rtol=1e-06, atol=1e-06)
+
 
 if __name__ == "__main__":
     unittest.main()
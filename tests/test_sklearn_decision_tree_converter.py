@@ -216,6 +216,38 @@ class TestSklearnTreeConverter(unittest.TestCase):
     def test_random_forest_perf_tree_trav_classifier_single_node_tree_converter(self):
         self._run_random_forest_classifier_single_node_tree_converter(extra_config={"tree_implementation": "perf_tree_trav"})
 
+    # Check that the input models are not modified by the conversion
+    def test_tree_converter_does_not_modify_input(self):
+        warnings.filterwarnings("ignore")
+        np.random.seed(0)
+        X = np.random.rand(100, 200)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(3, size=100)
+
+        # Decision tree
+        model = DecisionTreeClassifier(max_depth=8)
+        model.fit(X, y)
+        lefts = model.tree_.children_left.copy()
+        rights = model.tree_.children_right.copy()
+
+        torch_model = hummingbird.ml.convert(model, "torch")
+        self.assertIsNotNone(torch_model)
+        self.assertFalse(hasattr(model, "estimators_"))
+        np.testing.assert_array_equal(model.tree_.children_left, lefts)
+        np.testing.assert_array_equal(model.tree_.children_right, rights)
+
+        # Random forest
+        model = RandomForestClassifier(n_estimators=10, max_depth=8)
+        model.fit(X, y)
+        lefts = [tree.tree_.children_left.copy() for tree in model.estimators_]
+        rights = [tree.tree_.children_right.copy() for tree in model.estimators_]
+
+        torch_model = hummingbird.ml.convert(model, "torch")
+        self.assertIsNotNone(torch_model)
+        for tree, tree_lefts, tree_rights in zip(model.estimators_, lefts, rights):
+            np.testing.assert_array_equal(tree.tree_.children_left, tree_lefts)
+            np.testing.assert_array_equal(tree.tree_.children_right, tree_rights)
+
     # Failure Cases
     def test_random_forest_classifier_raises_wrong_type(self):
         warnings.filterwarnings("ignore")
@@ -160,6 +160,24 @@ class TestXGBoostConverter(unittest.TestCase):
     def test_xgb_perf_tree_trav_regressor_converter(self):
         self._run_xgb_regressor_converter(1000, extra_config={"tree_implementation": "perf_tree_trav"})
 
+    # Regressor without test input
+    @unittest.skipIf(
+        not xgboost_installed() or not hasattr(xgb.Booster, "num_features"),
+        reason="XGBoost test requires XGBoost installed with Booster.num_features",
+    )
+    def test_xgb_regressor_converter_no_test_input(self):
+        warnings.filterwarnings("ignore")
+        model = xgb.XGBRegressor(n_estimators=10, max_depth=3)
+        np.random.seed(0)
+        X = np.random.rand(100, 200)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(1000, size=100)
+
+        model.fit(X, y)
+        torch_model = hummingbird.ml.convert(model, "torch")
+        self.assertIsNotNone(torch_model)
+        np.testing.assert_allclose(model.predict(X), torch_model.predict(X), rtol=1e-06, atol=1e-06)
+
     # Small tree
     @unittest.skipIf(not xgboost_installed(), reason="XGBoost test requires XGBoost installed")
     def test_run_xgb_classifier_converter(self):